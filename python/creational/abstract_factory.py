@@ -15,6 +15,7 @@ context:
         specific concrete class;
 """
 
+import functools
 import random
 import time
 from abc import ABC, abstractmethod
@@ -23,6 +24,8 @@ from abc import ABC, abstractmethod
 class AbstractOutput(ABC):
     """Abstract standard output."""
 
+    __slots__ = ()
+
     @abstractmethod
     def write(self, value: str):
         """Writes to this output.
@@ -40,6 +43,8 @@ class AbstractProcess(ABC):
     processes.
     """
 
+    __slots__ = ("command",)
+
     def __init__(self, command: str):
         self.command = command
 
@@ -72,6 +77,8 @@ class SampleFactory(AbstractFactory):
     class Output(AbstractOutput):
         """Sample output."""
 
+        __slots__ = ("_p",)
+
         def __init__(self, prefix: str):
             self._p = prefix
 
@@ -81,12 +88,15 @@ class SampleFactory(AbstractFactory):
     class Process(AbstractProcess):
         """Sample process."""
 
+        __slots__ = ("_id", "_stdout", "_start", "_end", "_duration", "_deadline")
+
         def __init__(self, command: str, id: int, stdout: AbstractOutput):
             self.command = command
             self._id = id
             self._stdout = stdout
             self._start, self._end = None, None
             self._duration = random.randint(0, 3)
+            self._deadline = None
 
         def start(self):
             self._stdout.write(
@@ -94,12 +104,13 @@ class SampleFactory(AbstractFactory):
                 f"ETA of {self._duration} seconds."
             )
             self._start = time.perf_counter()
+            self._deadline = self._start + self._duration
 
         def is_running(self) -> bool:
             if self._start is None:
                 return False
 
-            return self._runtime() < self._duration
+            return time.perf_counter() < self._deadline
 
         def id(self) -> int:
             return self._id
@@ -109,13 +120,10 @@ class SampleFactory(AbstractFactory):
                 raise ValueError("Process hasn't started.")
 
             # Wait until process is finished
-            to_finish = self._duration - self._runtime()
-            if to_finish >= 0:
+            to_finish = self._deadline - time.perf_counter()
+            if to_finish > 0:
                 time.sleep(to_finish)
 
-        def _runtime(self):
-            return time.perf_counter() - self._start
-
     def __init__(self, os: str):
         self._stdout = self.Output(os)
         self._pid = 1
@@ -129,14 +137,21 @@ class SampleFactory(AbstractFactory):
         return self._stdout
 
 
-# Sample concrete factories
-WindowsFactory = SampleFactory("Windows")
-PosixFactory = SampleFactory("Posix")
+# Sample concrete factories, created on first use
+@functools.cache
+def windows_factory() -> SampleFactory:
+    return SampleFactory("Windows")
+
+
+@functools.cache
+def posix_factory() -> SampleFactory:
+    return SampleFactory("Posix")
+
 
 if __name__ == "__main__":
     # Runtime selection of singleton factory
     os = random.randint(0, 1)
-    factory: AbstractFactory = WindowsFactory if os == 0 else PosixFactory
+    factory: AbstractFactory = windows_factory() if os == 0 else posix_factory()
 
     # Create instances
     stdout: AbstractOutput = factory.stdout()
@@ -18,10 +18,13 @@ context:
         network can be called as a function;
 """
 
+import itertools
 import math
+import operator
 import random
+from array import array
 from enum import Enum, auto
-from typing import Callable, Self
+from typing import Callable, Iterable, Self
 
 
 class Activation(Enum):
@@ -37,6 +40,30 @@ class Activation(Enum):
     Tanh = auto()
 
 
+def _fwd_linear(W: list[list[float]], b: list[float], x: list[float]) -> list[float]:
+    return [sum(map(operator.mul, w, x)) + b_ for w, b_ in zip(W, b)]
+
+
+def _fwd_relu(W: list[list[float]], b: list[float], x: list[float]) -> list[float]:
+    return [
+        z if (z := sum(map(operator.mul, w, x)) + b_) > 0.0 else 0.0
+        for w, b_ in zip(W, b)
+    ]
+
+
+def _fwd_tanh(W: list[list[float]], b: list[float], x: list[float]) -> list[float]:
+    return [math.tanh(sum(map(operator.mul, w, x)) + b_) for w, b_ in zip(W, b)]
+
+
+_FORWARD: dict[
+    Activation, Callable[[list[list[float]], list[float], list[float]], list[float]]
+] = {
+    Activation.Linear: _fwd_linear,
+    Activation.ReLU: _fwd_relu,
+    Activation.Tanh: _fwd_tanh,
+}
+
+
 class Layer:
     """Represents a fully connected layer of
     neurons.
@@ -44,46 +71,73 @@ class Layer:
     :param n_input: input size.
     :param n_output: output size.
     :param activation: activation function.
+    :param initialize: whether to randomly initialize
+        the weights on construction. Otherwise, no
+        weights are allocated until `initialize` or
+        `load_weights` is called.
 
     This class abstracts the following process:
         - For each output neuron, <n_input> weights
-            are created (non-initialized);
-        - On forward pass, each output neuron computes
+            are stored as a row of the layer's weight
+            matrix;
+        - On forward pass, each row computes
             activation(sum(input * weight) + b);
         - The output is a list with size <n_output>;
     """
 
     class Neuron:
-        def __init__(self, n_input: int):
-            self.parameters = [None] * n_input
-            self.bias = None
-            self._initialized = False
+        """View over a single output neuron
+        of a layer.
+
+        :param layer: layer that owns the weights.
+        :param index: index of the neuron in the layer.
+        """
+
+        __slots__ = ("_layer", "_index")
+
+        def __init__(self, layer: "Layer", index: int):
+            self._layer = layer
+            self._index = index
+
+        @property
+        def parameters(self) -> list[float]:
+            self._layer._check_initialized()
+            return self._layer._W[self._index]
 
-        def init(self, parameters: list[float], bias: float):
-            assert len(parameters) == len(self.parameters)
-            self.parameters = parameters
-            self.bias = bias
-            self._initialized = True
+        @property
+        def bias(self) -> float:
+            self._layer._check_initialized()
+            return self._layer._b[self._index]
 
         def __call__(self, x: list[float]) -> float:
-            assert self._initialized
-            return sum(w * x_ for x_, w in zip(x, self.parameters)) + self.bias
+            self._layer._check_initialized()
+            return sum(map(operator.mul, self.parameters, x)) + self.bias
 
         def __str__(self) -> str:
             return (
                 f"{self.__class__.__name__}"
-                f"(parameters={len(self.parameters)}, bias=1)"
+                f"(parameters={self._layer.input_shape()}, bias=1)"
             )
 
         def __repr__(self) -> str:
             return str(self)
 
-    def __init__(self, n_input: int, n_output: int, activation: Activation):
+    def __init__(
+        self,
+        n_input: int,
+        n_output: int,
+        activation: Activation,
+        initialize: bool = False,
+    ):
         self._activation = activation
-        self._activation_fn = self._get_activation(activation)
+        self._forward = _FORWARD[activation]
         self._input = n_input
         self._output = n_output
-        self._neurons = [self.Neuron(n_input) for _ in range(n_output)]
+        self._W: list[list[float]] | None = None
+        self._b: list[float] | None = None
+        self._n_params = (n_input + 1) * n_output
+        if initialize:
+            self.initialize()
 
     def activation(self) -> Activation:
         return self._activation
@@ -94,42 +148,56 @@ class Layer:
     def output_shape(self) -> int:
         return self._output
 
+    def neurons(self) -> list[Neuron]:
+        return [self.Neuron(self, i) for i in range(self._output)]
+
+    def num_parameters(self) -> int:
+        return self._n_params
+
     def parameters(self) -> list[float]:
-        return [
-            param
-            for neuron in self._neurons
-            for param in neuron.parameters + [neuron.bias]
-        ]
+        return list(self.iter_parameters())
+
+    def iter_parameters(self) -> Iterable[float]:
+        """Iterate over the parameters without
+        building a list: weights row by row,
+        then biases.
+        """
+        self._check_initialized()
+        return itertools.chain(*self._W, self._b)
 
     def initialize(self):
-        for n in self._neurons:
-            n.init(
-                [random.uniform(-1, 1) for _ in range(self._input)],
-                random.random(),
-            )
+        self._W = [
+            [random.uniform(-1, 1) for _ in range(self._input)]
+            for _ in range(self._output)
+        ]
+        self._b = [random.random() for _ in range(self._output)]
+
+    def load_weights(self, W: list[list[float]], b: list[float]):
+        """Load pre-existing weights.
+
+        :param W: weights with shape (<n_output>, <n_input>).
+        :param b: biases with size <n_output>.
+        """
+        assert len(W) == self._output and len(b) == self._output
+        assert all(len(w) == self._input for w in W)
+        self._W = [list(map(float, w)) for w in W]
+        self._b = list(map(float, b))
 
     def __call__(self, x: list[float]) -> list[float]:
-        return [self._activation_fn(neuron(x)) for neuron in self._neurons]
+        self._check_initialized()
+        return self._forward(self._W, self._b, x)
 
     def __str__(self) -> str:
         return (
             f"Layer(n_input={self._input}, "
             f"n_output={self._output}, "
-            f"parameters={len(self.parameters())}, "
+            f"parameters={self._n_params}, "
             f"activation={self._activation.name})"
         )
 
-    @staticmethod
-    def _get_activation(activation: Activation) -> Callable[[float], float]:
-        match activation:
-            case Activation.Linear:
-                return lambda x: x
-            case Activation.ReLU:
-                return lambda x: max(0, x)
-            case Activation.Tanh:
-                return lambda x: (math.exp(x) - math.exp(-x)) / (
-                    math.exp(x) + math.exp(-x)
-                )
+    def _check_initialized(self):
+        if self._W is None:
+            raise ValueError("Layer hasn't been initialized.")
 
 
 class NeuralNetwork:
@@ -147,8 +215,16 @@ class NeuralNetwork:
         self.layers = layers
         self.names = names
 
-    def parameters(self) -> list[float]:
-        return [param for layer in self.layers for param in layer.parameters()]
+    def num_parameters(self) -> int:
+        return sum(l.num_parameters() for l in self.layers)
+
+    def parameters(self) -> array:
+        """Return all parameters as a single
+        contiguous array of doubles, in the same
+        order as `Layer.parameters`.
+        """
+        params = itertools.chain.from_iterable(l.iter_parameters() for l in self.layers)
+        return array("d", params)
 
     def initialize(self):
         for l in self.layers:
@@ -163,7 +239,7 @@ class NeuralNetwork:
         spacing = "=" * 20
         repr = [spacing, "Network Architecture", spacing, "Layers:"]
         repr.extend([f"\t{name}: {l}" for name, l in zip(self.names, self.layers)])
-        repr.append(f"Total parameters: {len(self.parameters())}")
+        repr.append(f"Total parameters: {self.num_parameters()}")
         repr.append(spacing)
         return "\n".join(repr)
 
@@ -190,7 +266,7 @@ class NetworkBuilder:
         return self.add_layer(output_size, Activation.ReLU)
 
     def add_tanh(self, output_size: int) -> Self:
-        return self.add_layer(output_size, Activation.Linear)
+        return self.add_layer(output_size, Activation.Tanh)
 
     def add_layer(self, output_size: int, activation: Activation) -> Self:
         input_size = self._input
@@ -201,8 +277,17 @@ class NetworkBuilder:
         self._names.append(f"{activation.name} {self._counter[activation]}")
         return self
 
-    def build(self) -> NeuralNetwork:
-        return NeuralNetwork(self._layers, names=self._names)
+    def build(self, initialize: bool = False) -> NeuralNetwork:
+        """Build the network.
+
+        :param initialize: whether to randomly initialize
+            the weights. Leave it off when weights are
+            going to be loaded afterwards.
+        """
+        network = NeuralNetwork(self._layers, names=self._names)
+        if initialize:
+            network.initialize()
+        return network
 
 
 if __name__ == "__main__":
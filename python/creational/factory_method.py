@@ -21,6 +21,8 @@ import re
 import string
 from abc import ABC, abstractmethod
 
+_SUM_PATTERN = re.compile(r"SUM ([0-9]+) \+ ([0-9]+)")
+
 
 class AbstractResponse(ABC):
     """Abstract response.
@@ -99,9 +101,10 @@ class SumProcessor(AbstractProcessor):
         return self._response(data)
 
     def process(self, event: str) -> str:
-        match = re.fullmatch(r"SUM (?P<a>[0-9]+) \+ (?P<b>[0-9]+)", event)
-        assert match is not None, "Unknown event"
-        return f"RESULT {int(match.group('a')) + int(match.group('b'))}"
+        match = event.startswith("SUM ") and _SUM_PATTERN.fullmatch(event)
+        assert match, "Unknown event"
+        a, b = match.groups()
+        return f"RESULT {int(a) + int(b)}"
 
 
 if __name__ == "__main__":
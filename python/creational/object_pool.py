@@ -19,9 +19,12 @@ context:
         of time on each call;
 """
 
+import itertools
+import operator
 import random
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
@@ -35,6 +38,8 @@ class AbstractModel(ABC, Generic[K, T]):
     running predictions.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def predict(self, x: list[K]) -> list[T]:
         """Run an inference.
@@ -52,44 +57,55 @@ class ModelPool(Generic[K, T]):
     """Model pool."""
 
     def __init__(self):
-        self._objects: dict[str, dict] = dict(free=dict(), in_use=dict())
+        self._free: deque[AbstractModel[K, T]] = deque()
+        self._in_use: set[AbstractModel[K, T]] = set()
+        self._models: set[AbstractModel[K, T]] = set()
 
     def add(self, model: AbstractModel[K, T]):
-        key = id(model)
-        assert all(key not in self._objects[k] for k in ["free", "in_use"])
-        self._objects["free"][key] = model
+        assert model not in self._models
+        self._models.add(model)
+        self._free.append(model)
 
     def get(self) -> AbstractModel[K, T]:
-        key, model = self._objects["free"].popitem()
-        self._objects["in_use"][key] = model
+        model = self._free.popleft()
+        self._in_use.add(model)
         return model
 
     def release(self, model: AbstractModel[K, T]):
-        key = id(model)
-        assert key in self._objects["in_use"]
-        del self._objects["in_use"][key]
+        assert model in self._in_use
+        self._in_use.remove(model)
         model.reset()
-        self._objects["free"][key] = model
+        self._free.append(model)
 
     def free_count(self) -> int:
-        return len(self._objects["free"])
+        return len(self._free)
 
     def in_use_count(self) -> int:
-        return len(self._objects["in_use"])
+        return len(self._in_use)
 
     def __str__(self) -> str:
         return f"Pool(free={self.free_count()}, in_use={self.in_use_count()})"
 
 
 class SampleModel(AbstractModel[int, int]):
-    def __init__(self):
+    """Sample model.
+
+    :param simulate_latency: seconds to sleep
+        during initialization, simulating a slow
+        model load.
+    """
+
+    __slots__ = ("_shift",)
+
+    def __init__(self, simulate_latency: float = 0.0):
         self._shift = [random.randint(-10, 10) for _ in range(10)]
 
         # Simulate slow initialization
-        time.sleep(0.5)
+        if simulate_latency:
+            time.sleep(simulate_latency)
 
     def predict(self, x: list[int]) -> list[int]:
-        return [x_ + self._shift[i % len(self._shift)] for i, x_ in enumerate(x)]
+        return list(map(operator.add, x, itertools.cycle(self._shift)))
 
     def reset(self):
         # No-op, stateless model
@@ -104,7 +120,7 @@ if __name__ == "__main__":
     # Add some models to the pool
     print("Creating some models...")
     for _ in range(3):
-        pool.add(SampleModel())
+        pool.add(SampleModel(simulate_latency=0.5))
 
     # Show pool state
     print(pool)
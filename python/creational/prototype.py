@@ -24,9 +24,42 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj) -> str:
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+
+
+# Serialize with orjson when available. Note that the
+#   output is not identical to json: orjson writes NaN
+#   and infinite floats as null, while json writes
+#   NaN/Infinity.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # orjson is stricter than json (e.g., integers
+            #   beyond 64 bits), so fall back to it
+            return _json_dumps(obj)
+
+except ImportError:
+    _dumps = _json_dumps
+
+
 class LoadPrototype(ABC):
     """Data (payload) with metadata."""
 
+    __slots__ = ()
+
     @abstractmethod
     def initialize(self, payload: dict):
         """Initialize the load with the
@@ -37,6 +70,15 @@ class LoadPrototype(ABC):
     def send(self):
         """Send the payload."""
 
+    @abstractmethod
+    def send_with(self, payload: dict):
+        """Send another payload with the
+        metadata of this load, without
+        changing its own payload.
+
+        :param payload: payload to send.
+        """
+
     @abstractmethod
     def clone(self) -> "LoadPrototype":
         """Return clone of self."""
@@ -74,6 +116,8 @@ class LoadManager:
 
 
 class PlainLoad(LoadPrototype):
+    __slots__ = ("_should_encode", "_payload")
+
     def __init__(self, should_encode: bool = False, payload: dict = None):
         self._should_encode = should_encode
         self._payload = payload
@@ -83,16 +127,22 @@ class PlainLoad(LoadPrototype):
 
     def send(self):
         assert self._payload is not None
-        data = str(self._payload)
+        self.send_with(self._payload)
+
+    def send_with(self, payload: dict):
         if self._should_encode:
-            data = "ENCODED: " + base64.b64encode(data.encode()).decode()
-        print(f"[PlainLoad] {data}")
+            encoded = base64.b64encode(str(payload).encode())
+            print("[PlainLoad] ENCODED:", encoded.decode("ascii"))
+        else:
+            print("[PlainLoad]", payload)
 
     def clone(self) -> "PlainLoad":
         return PlainLoad(self._should_encode, self._payload)
 
 
 class HttpLoad(LoadPrototype):
+    __slots__ = ("_url", "_payload")
+
     def __init__(self, url: str, payload: dict = None):
         self._url = url
         self._payload = payload
@@ -102,11 +152,12 @@ class HttpLoad(LoadPrototype):
 
     def send(self):
         assert self._payload is not None
-        data = dict(
-            timestamp=datetime.now().isoformat(), version=1.0, data=self._payload
-        )
+        self.send_with(self._payload)
+
+    def send_with(self, payload: dict):
+        data = dict(timestamp=datetime.now(), version=1.0, data=payload)
         print(f"[HttpLoad] POST to {self._url} with body:")
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        print(_dumps(data))
 
     def clone(self) -> "HttpLoad":
         return HttpLoad(self._url, self._payload)
@@ -122,6 +173,7 @@ if __name__ == "__main__":
     registry.register(HttpLoad("http://localhost:8484"), key="http")
 
     # Simulate components
+    kept: list[LoadPrototype] = []
     for _ in range(10):
         # Generate random payload
         payload = dict(value=random.randint(0, 1000))
@@ -129,9 +181,19 @@ if __name__ == "__main__":
         # Get prototype
         prototype = registry.get(random.choice([None, "plain", "base64", "http"]))
 
-        # Initialize load
-        load = prototype.clone()
-        load.initialize(payload)
-
-        # Send data
+        if random.randint(0, 1) == 1:
+            # Loads that are kept around get their
+            #   own copy of the prototype
+            load = prototype.clone()
+            load.initialize(payload)
+            load.send()
+            kept.append(load)
+        else:
+            # One-off sends can use the prototype's
+            #   metadata directly, without a clone
+            prototype.send_with(payload)
+
+    # Send kept loads again
+    print(f"Resending {len(kept)} kept loads...")
+    for load in kept:
         load.send()
@@ -25,6 +25,8 @@ T = TypeVar("T", int, float)
 class Model(ABC, Generic[T]):
     """Simple numeric model interface."""
 
+    __slots__ = ()
+
     @abstractmethod
     def fit(self, x: list[list[T]], y: list[int]):
         """Train the model.
@@ -46,6 +48,8 @@ class Model(ABC, Generic[T]):
 class AdapterLibraryA(Model[T]):
     """Adapter for objects of a library A."""
 
+    __slots__ = ("_max", "_min")
+
     def __init__(self, obj: Any):
         # Real implementation should
         #   store whatever is needed
@@ -55,28 +59,34 @@ class AdapterLibraryA(Model[T]):
         self._min = 0
 
     def fit(self, x: list[list[T]], y: list[int]):
-        self._max = max(y)
-        self._min = min(y)
+        self._max = int(max(y))
+        self._min = int(min(y))
 
     def predict(self, x: list[list[T]]) -> list[int]:
-        return [min(self._max, max(self._min, int(max(x_)))) for x_ in x]
+        lo, hi = self._min, self._max
+        return [lo if v < lo else hi if v > hi else int(v) for v in map(max, x)]
 
 
 class AdapterLibraryB(Model[T]):
     """Adapter for objects of a library B."""
 
+    __slots__ = ("_max", "_min")
+
     def __init__(self, obj: Any):
         # Real implementation should
         #   store whatever is needed
         #   to implement fit+predict.
         del obj
+        self._max = 0
+        self._min = 0
 
     def fit(self, x: list[list[T]], y: list[int]):
-        self._max = max(y)
-        self._min = min(y)
+        self._max = int(max(y))
+        self._min = int(min(y))
 
     def predict(self, x: list[list[T]]) -> list[int]:
-        return [min(self._max, max(self._min, int(min(x_)))) for x_ in x]
+        lo, hi = self._min, self._max
+        return [lo if v < lo else hi if v > hi else int(v) for v in map(min, x)]
 
 
 if __name__ == "__main__":